@@ -8,9 +8,12 @@ Usage:
     Run this module as part of a Streamlit app to provide a helper interface for Digipos API operations.
 """
 
+import asyncio
+import threading
 from typing import Any
 
-import requests
+import httpx
+import orjson
 import streamlit as st
 
 from utils.mlogger import logger
@@ -24,28 +27,70 @@ DEFAULTS = {
     "msisdn": "081222249504",
 }
 
-# --- Init session state default ---
-for key, value in DEFAULTS.items():
-    st.session_state.setdefault(key, value)
-for key in [
-    "digipos_login_response",
-    "digipos_otp_response",
-    "digipos_profile_response",
-    "digipos_balance_response",
-    "digipos_logout_response",
-]:
-    st.session_state.setdefault(key, None)
+_DEFAULTS = {
+    **DEFAULTS,
+    "digipos_login_response": None,
+    "digipos_otp_response": None,
+    "digipos_profile_response": None,
+    "digipos_balance_response": None,
+    "digipos_logout_response": None,
+}
+
+# --- Init session state default (sekali per session, bukan per rerun) ---
+if "_digipos_init" not in st.session_state:
+    st.session_state.update(_DEFAULTS)
+    st.session_state._digipos_init = True
+
+
+# --- HTTP Client (shared pool, HTTP/2 multiplexing) ---
+@st.cache_resource
+def _loop() -> asyncio.AbstractEventLoop:
+    """Return a background event loop shared by all reruns.
+
+    Loop hidup di daemon thread sendiri supaya AsyncClient yang di-cache
+    selalu jalan di loop yang sama — asyncio.run() per call akan membuat
+    loop baru dan merusak pool koneksi client.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+
+@st.cache_resource
+def _aclient() -> httpx.AsyncClient:
+    """Return a shared httpx.AsyncClient with keep-alive and HTTP/2.
+
+    Dibuat sekali per proses (cache_resource) supaya semua rerun Streamlit
+    memakai pool koneksi yang sama — call yang paralel di-multiplex pada
+    satu koneksi, bukan buka socket baru per call.
+    """
+    # http2/limits harus di transport: kalau transport= eksplisit diberikan,
+    # httpx memakai transport itu apa adanya dan kwargs client diabaikan.
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(10.0, connect=3.0),
+        transport=httpx.AsyncHTTPTransport(
+            retries=2,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=8),
+        ),
+    )
 
 
 # --- Helper Call API ---
-def call_api(
-    url: str, method: str = "GET", username: str = "", action: str = ""
+async def call_api_async(
+    url: str,
+    method: str = "GET",
+    params: dict[str, Any] | None = None,
+    username: str = "",
+    action: str = "",
 ) -> dict[str, Any]:
     """Call an API endpoint and return the response as a dictionary.
 
     Args:
-        url (str): The API endpoint URL.
+        url (str): The API endpoint URL (tanpa query string).
         method (str, optional): HTTP method to use. Defaults to "GET".
+        params (dict | None, optional): Query parameters; httpx yang
+            melakukan urlencode, jadi aman untuk karakter spesial.
         username (str, optional): Username for logging context. Defaults to "".
         action (str, optional): Action name for logging context. Defaults to "".
 
@@ -53,24 +98,31 @@ def call_api(
         dict[str, Any]: The parsed JSON response or error information.
     """
     log_ctx = logger.bind(username=username, action=action)
-    log_ctx.info(f"Call API: {url}")
+    log_ctx.info("Call API: {}", url)
     try:
-        resp = requests.request(method, url, timeout=10)
+        resp = await _aclient().request(method, url, params=params)
         resp.raise_for_status()
-        log_ctx.success(f"API success: {url}")
-        return (
-            resp.json()
-            if resp.headers.get("content-type", "").startswith("application/json")
-            else {"text": resp.text}
-        )
+        log_ctx.success("API success: {}", url)
+        ct = resp.headers.get("content-type", "")
+        # orjson langsung parse bytes, tanpa decode str dulu.
+        return orjson.loads(resp.content) if "json" in ct else {"text": resp.text}
     except Exception as e:
         log_ctx.exception("API error")
         return {"error": str(e)}
 
 
-# --- UI: Header ---
-st.title(":material/api: Digipos API Helper")
-st.caption("Helper untuk akses API Digipos secara cepat.")
+def call_api(
+    url: str,
+    method: str = "GET",
+    params: dict[str, Any] | None = None,
+    username: str = "",
+    action: str = "",
+) -> dict[str, Any]:
+    """Synchronous wrapper around call_api_async on the shared loop."""
+    future = asyncio.run_coroutine_threadsafe(
+        call_api_async(url, method, params, username, action), _loop()
+    )
+    return future.result()
 
 
 # --- Fragment: Login ---
@@ -97,9 +149,14 @@ def login_block():
             submitted = st.form_submit_button("Login")
 
         if submitted:
-            url = f"{BASEURL}/add_account?username={st.session_state.username}&password={st.session_state.password}"
             st.session_state.digipos_login_response = call_api(
-                url, username=st.session_state.username or "", action="login"
+                f"{BASEURL}/add_account",
+                params={
+                    "username": st.session_state.username,
+                    "password": st.session_state.password,
+                },
+                username=st.session_state.username or "",
+                action="login",
             )
 
         if st.session_state.digipos_login_response:
@@ -107,9 +164,6 @@ def login_block():
             st.json(st.session_state.digipos_login_response)
 
 
-login_block()
-
-
 # --- Fragment: OTP Verification ---
 @st.fragment
 def otp_block():
@@ -124,9 +178,11 @@ def otp_block():
             submitted = st.form_submit_button("Verifikasi OTP")
 
         if submitted:
-            url = f"{BASEURL}/add_account_otp?username={st.session_state.username}&otp={otp}"
             st.session_state.digipos_otp_response = call_api(
-                url, username=st.session_state.username, action="otp"
+                f"{BASEURL}/add_account_otp",
+                params={"username": st.session_state.username, "otp": otp},
+                username=st.session_state.username,
+                action="otp",
             )
 
         if st.session_state.digipos_otp_response:
@@ -134,41 +190,76 @@ def otp_block():
             st.json(st.session_state.digipos_otp_response)
 
 
-otp_block()
-
-
 # --- Fragment: Info Akun (Profile / Balance) ---
-@st.fragment
+@st.fragment(run_every="30s")
 def info_block():
     """Streamlit fragment for displaying Digipos account profile and balance.
 
     Provides buttons to fetch and display profile and balance information
-    from the Digipos API.
+    from the Digipos API. Fragment rerun tiap 30 detik; kalau toggle polling
+    aktif, balance ikut di-refresh tanpa menjalankan ulang seluruh script.
     """
     with st.expander("3. Info Akun (Profile & Balance)", expanded=True):
+        polling = st.toggle(
+            "Auto-refresh balance (30s)", key="digipos_balance_polling"
+        )
+        if polling:
+            st.session_state.digipos_balance_response = call_api(
+                f"{BASEURL}/balance",
+                params={"username": st.session_state.username},
+                username=st.session_state.username,
+                action="balance",
+            )
+        if st.button(":material/sync: Refresh Both"):
+            user_params = {"username": st.session_state.username}
+            # Dua GET independen, di-multiplex di satu koneksi HTTP/2 —
+            # wall time ~ max, bukan sum.
+            loop = _loop()
+            f_profile = asyncio.run_coroutine_threadsafe(
+                call_api_async(
+                    f"{BASEURL}/profile",
+                    params=user_params,
+                    username=st.session_state.username,
+                    action="profile",
+                ),
+                loop,
+            )
+            f_balance = asyncio.run_coroutine_threadsafe(
+                call_api_async(
+                    f"{BASEURL}/balance",
+                    params=user_params,
+                    username=st.session_state.username,
+                    action="balance",
+                ),
+                loop,
+            )
+            st.session_state.digipos_profile_response = f_profile.result()
+            st.session_state.digipos_balance_response = f_balance.result()
+
         col1, col2 = st.columns(2)
         with col1:
             if st.button(":material/person: Profile"):
-                url = f"{BASEURL}/profile?username={st.session_state.username}"
                 st.session_state.digipos_profile_response = call_api(
-                    url, username=st.session_state.username, action="profile"
+                    f"{BASEURL}/profile",
+                    params={"username": st.session_state.username},
+                    username=st.session_state.username,
+                    action="profile",
                 )
             if st.session_state.digipos_profile_response:
                 st.json(st.session_state.digipos_profile_response)
 
         with col2:
             if st.button(":material/paid: Balance"):
-                url = f"{BASEURL}/balance?username={st.session_state.username}"
                 st.session_state.digipos_balance_response = call_api(
-                    url, username=st.session_state.username, action="balance"
+                    f"{BASEURL}/balance",
+                    params={"username": st.session_state.username},
+                    username=st.session_state.username,
+                    action="balance",
                 )
             if st.session_state.digipos_balance_response:
                 st.json(st.session_state.digipos_balance_response)
 
 
-info_block()
-
-
 # --- Fragment: Logout ---
 @st.fragment
 def logout_block():
@@ -178,13 +269,30 @@ def logout_block():
     """
     with st.expander("4. Logout Akun Digipos", expanded=True):
         if st.button(":material/logout: Logout"):
-            url = f"{BASEURL}/logout?username={st.session_state.username}"
             st.session_state.digipos_logout_response = call_api(
-                url, username=st.session_state.username, action="logout"
+                f"{BASEURL}/logout",
+                params={"username": st.session_state.username},
+                username=st.session_state.username,
+                action="logout",
             )
 
         if st.session_state.digipos_logout_response:
             st.json(st.session_state.digipos_logout_response)
 
 
-logout_block()
+# --- Render Page ---
+def render() -> None:
+    """Render the whole Digipos helper page.
+
+    Satu-satunya side effect di level modul; tiap block tetap fragment
+    sendiri, jadi rerun hanya mengenai block yang berubah.
+    """
+    st.title(":material/api: Digipos API Helper")
+    st.caption("Helper untuk akses API Digipos secara cepat.")
+    login_block()
+    otp_block()
+    info_block()
+    logout_block()
+
+
+render()
@@ -1,8 +1,9 @@
-from .database import get_db_conn, read_query, test_connection, write_query
+from .database import get_db_conn, read_query, test_connection, write_many, write_query
 
 __all__ = [
     "get_db_conn",
     "read_query",
     "test_connection",
+    "write_many",
     "write_query",
 ]
@@ -17,11 +17,14 @@ Usage:
     df = conn.query("SELECT ...")
 """
 
+import functools
 from typing import Any
 
 import pandas as pd
 import streamlit as st
 from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from sqlalchemy.sql.elements import TextClause
 from streamlit.connections.sql_connection import SQLConnection
 
 from utils.mlogger import logger
@@ -30,9 +33,18 @@ from utils.mlogger import logger
 db_logger = logger.bind(module="database")
 
 
+@st.cache_resource
+def _conn(name: str) -> SQLConnection:
+    """Build the SQLConnection once per process; engine+pool gets reused."""
+    return st.connection(name, type="sql")
+
+
 def get_db_conn(name: str = "mssql") -> SQLConnection:
     """Get a Streamlit SQLConnection by name.
 
+    Koneksi di-cache dengan st.cache_resource supaya engine SQLAlchemy dan
+    pool-nya dibangun sekali saja, bukan tiap pemanggilan.
+
     Args:
         name (str): Connection name (default: "mssql").
 
@@ -43,7 +55,28 @@ def get_db_conn(name: str = "mssql") -> SQLConnection:
         conn = get_db_conn()
         df = conn.query("SELECT ...")
     """
-    return st.connection(name, type="sql")
+    return _conn(name)
+
+
+def _reset_conn(conn: SQLConnection) -> None:
+    """Reset a broken connection and drop its cache entry so it isn't pinned."""
+    conn.reset()
+    _conn.clear()
+
+
+def _is_retryable(e: DBAPIError) -> bool:
+    """Return True only for connection-level failures worth a reset+retry.
+
+    SQL error biasa (syntax salah, constraint violation) akan tetap gagal
+    setelah reset — jangan buang round trip untuk retry yang sia-sia.
+    """
+    return isinstance(e, OperationalError | InterfaceError) or e.connection_invalidated
+
+
+@functools.lru_cache(maxsize=256)
+def _stmt(sql: str) -> TextClause:
+    """Memoize text(sql) so hot queries skip re-parsing bind parameters."""
+    return text(sql)
 
 
 def read_query(
@@ -55,6 +88,9 @@ def read_query(
 ) -> pd.DataFrame:
     """Run a read-only query (SELECT) with auto-reset if connection is not healthy.
 
+    conn.query sudah meng-cache hasil per (sql, params) dengan ttl yang
+    diberikan, jadi rerun dengan query sama tidak menyentuh database lagi.
+
     Args:
         sql (str): SQL SELECT query.
         params (dict | None): Query parameters.
@@ -71,12 +107,14 @@ def read_query(
     log = db_logger if req_id is None else db_logger.bind(request_id=req_id)
     conn = get_db_conn(name)
     try:
-        log.debug(f"Executing query: {sql} with params: {params}")
-        return conn.query(sql, params=params, ttl=ttl)
-    except Exception as e:
-        log.warning(f"Query failed, resetting connection: {e}")
-        conn.reset()
+        log.debug("Executing query: {} with params: {}", sql, params)
         return conn.query(sql, params=params, ttl=ttl)
+    except DBAPIError as e:
+        if not _is_retryable(e):
+            raise
+        log.warning("Query failed, resetting connection: {}", e)
+        _reset_conn(conn)
+        return get_db_conn(name).query(sql, params=params, ttl=ttl)
 
 
 def write_query(
@@ -100,14 +138,58 @@ def write_query(
     conn = get_db_conn(name)
     try:
         with conn.session as session:
-            log.debug(f"Executing write query: {sql} with params: {params}")
-            session.execute(text(sql), params)
+            log.debug("Executing write query: {} with params: {}", sql, params)
+            session.execute(_stmt(sql), params)
             session.commit()
-    except Exception as e:
-        log.warning(f"Write failed, resetting connection: {e}")
-        conn.reset()
+    except DBAPIError as e:
+        if not _is_retryable(e):
+            raise
+        log.warning("Write failed, resetting connection: {}", e)
+        _reset_conn(conn)
+        conn = get_db_conn(name)
+        with conn.session as session:
+            session.execute(_stmt(sql), params)
+            session.commit()
+
+
+def write_many(
+    sql: str,
+    params_list: list[dict[str, Any]],
+    name: str = "mssql",
+    req_id: str | None = None,
+) -> None:
+    """Run one write statement for many parameter sets in a single transaction.
+
+    Memakai jalur executemany SQLAlchemy: bind sekali, satu commit — jauh
+    lebih cepat daripada loop write_query per baris.
+
+    Args:
+        sql (str): SQL write query.
+        params_list (list[dict]): One parameter dict per row.
+        name (str): Connection name.
+        req_id (str | None): Optional request id for log context.
+
+    Usage:
+        write_many(
+            "INSERT INTO users (name) VALUES (:name)",
+            params_list=[{"name": "a"}, {"name": "b"}],
+        )
+    """
+    log = db_logger if req_id is None else db_logger.bind(request_id=req_id)
+    conn = get_db_conn(name)
+    try:
         with conn.session as session:
-            session.execute(text(sql), params)
+            log.debug("Executing batch write: {} with {} rows", sql, len(params_list))
+            session.execute(_stmt(sql), params_list)
+            session.commit()
+    except DBAPIError as e:
+        if not _is_retryable(e):
+            raise
+        log.warning("Batch write failed, resetting connection: {}", e)
+        _reset_conn(conn)
+        conn = get_db_conn(name)
+        with conn.session as session:
+            session.execute(_stmt(sql), params_list)
             session.commit()
 
 
@@ -129,9 +211,12 @@ def test_connection(name: str = "mssql", req_id: str | None = None) -> bool:
     conn = get_db_conn(name)
     try:
         log.debug("Testing database connection...")
-        conn.query(sql="SELECT @@VERSION;")
+        # Raw execute, bukan conn.query: healthcheck tidak perlu DataFrame,
+        # Arrow conversion, atau mesin cache Streamlit.
+        with conn.session as session:
+            session.execute(text("SELECT 1"))
     except Exception as e:
-        log.warning(f"Connection test failed: {e}")
+        log.warning("Connection test failed: {}", e)
         return False
     else:
         return True
@@ -1,3 +1,5 @@
+import os
+
 import streamlit as st
 
 from utils.mlogger import LogConfig, LoggerManager, logger
@@ -6,7 +8,7 @@ from utils.mlogger import LogConfig, LoggerManager, logger
 def setup_logger() -> None:
     """Initialize the logger for the application."""
     log_config = LogConfig(
-        level="DEBUG",
+        level=os.getenv("LOG_LEVEL", "INFO"),
         to_terminal=True,
         to_file=False,
         format_style="simple",
@@ -98,8 +100,13 @@ previous_page = st.session_state.get("current_page", "unknown")
 
 if current_page != previous_page:
     user = st.session_state.get("username", "guest")
-    logger_ctx = logger.bind(user=user, navigasi=f"{previous_page} -> {current_page}")
-    logger_ctx.debug("User membuka halaman")
+    # Bound logger di-memo per (user, page) — logger.bind() mengalokasikan
+    # Logger baru tiap call, sayang dilakukan ulang untuk page yang sudah pernah dibuka.
+    nav_loggers = st.session_state.setdefault("_nav_loggers", {})
+    logger_ctx = nav_loggers.setdefault(
+        (user, current_page), logger.bind(user=user, page=current_page)
+    )
+    logger_ctx.debug(f"User membuka halaman: {previous_page} -> {current_page}")
 
 # Update state
 st.session_state.current_page = current_page
@@ -0,0 +1,36 @@
+"""Shared voucher data loader.
+
+Satu implementasi (dan satu cache entry) untuk semua page voucher —
+jangan duplikasi get_voucherdata di tiap page.
+"""
+
+import streamlit as st
+
+from config import read_query
+from utils.mlogger import logger
+
+# SQL sebagai konstanta modul; heredoc di dalam fungsi dialokasikan ulang
+# tiap call. TODO: ganti SELECT * dengan daftar kolom yang benar-benar
+# dipakai laporan supaya bytes dari SQL Server lebih kecil.
+_VOUCHER_SQL = "SELECT * FROM vouchers WHERE status = 'active'"
+
+# Cache 5 menit lintas rerun dan session lewat ttl conn.query — tanpa ttl
+# hasilnya di-cache selamanya dan data voucher tidak pernah refresh.
+_VOUCHER_TTL = 300
+
+
+def get_voucherdata() -> None:
+    """Get voucher data from database and save to session state."""
+    # Satu .get() dict-style, bukan __contains__ + assignment atribut
+    # lewat proxy session_state — path panas karena jalan tiap rerun.
+    if st.session_state.get("voucher_data") is None:
+        try:
+            st.session_state["voucher_data"] = read_query(
+                _VOUCHER_SQL, ttl=_VOUCHER_TTL
+            )
+            logger.info("Voucher data loaded successfully.")
+        except Exception as e:
+            logger.error(f"Failed to load voucher data: {e}")
+            st.error("Gagal memuat data voucher.")
+    else:
+        logger.debug("Voucher data already in session state.")
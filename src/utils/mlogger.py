@@ -69,24 +69,47 @@ Author: Maki & ChatGPT
 """
 
 import asyncio
+import atexit
+import contextlib
 import functools
-import inspect
+import gzip
+import itertools
 import logging
 import os
+import queue
+import re
+import secrets
+import shutil
 import sys
+import threading
 import time
+import traceback
 import uuid
-from collections.abc import Callable, Iterator
-from contextlib import AbstractContextManager, contextmanager
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import date
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from time import perf_counter as _perf_counter
 from types import TracebackType
 from typing import Any, Literal, ParamSpec, TypeVar
 
+import orjson
 from loguru import logger as loguru_logger
 
 Level = Literal["TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL"]
 
+# Artefak type-checker murni; cukup dibangun sekali di level modul, bukan
+# dialokasikan ulang tiap pemanggilan decorator factory.
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+# Satu scan regex C-level per record, tanpa .lower() alokasi string penuh.
+_SENSITIVE_RE = re.compile(
+    r"(?:password|token|secret|apikey|authorization)", re.IGNORECASE
+)
+
 
 @dataclass
 class LogConfig:
@@ -95,7 +118,9 @@ class LogConfig:
     to_file: bool = False
     serialize: bool = False
     diagnose: bool = False
-    enqueue: bool = True
+    # Loguru enqueue memakai multiprocessing queue yang mahal untuk record
+    # kecil; decoupling ditangani QueueHandler/QueueListener di setup().
+    enqueue: bool = False
     log_path: str = "logs"
     name_prefix: str = "app"
     size_mb: int = 10
@@ -104,46 +129,219 @@ class LogConfig:
     format_style: Literal["simple", "full"] = "simple"
     bind_context: dict[str, Any] | None = None
     enable_exception_hooks: bool = True
+    # Routing logging stdlib ke Loguru; matikan untuk script/test pendek
+    # yang tidak mau root logger-nya disentuh.
+    intercept_stdlib: bool = True
+    # Level minimum record stdlib yang diteruskan — DEBUG library chatty
+    # tidak perlu membayar jalur intercept.
+    intercept_level: int = logging.WARNING
+
+
+# Level stdlib -> Loguru, dimemo karena nama level cuma segelintir dan tetap.
+_LEVEL_BY_NAME: dict[str, str | int] = {}
+
+# Level Loguru terendah yang masih punya sink; di-refresh oleh
+# LoggerManager.setup() tiap kali susunan sink berubah.
+_MIN_LEVEL_NO = 0
+
+# Listener queue stdlib: singleton per proses. setup() bisa terpanggil
+# sekali per session Streamlit; tanpa guard ini tiap session akan
+# membocorkan satu thread listener yatim.
+_STDLIB_LISTENER: QueueListener | None = None
+_STDLIB_LISTENER_LOCK = threading.Lock()
+
+# Sink file yang sedang aktif. Loguru membungkus callable dalam CallableSink
+# yang stop()-nya no-op, jadi logger.remove() tidak menutup file — sink lama
+# harus kita tutup sendiri saat setup() berikutnya.
+_FILE_SINKS: list["_OrjsonFileSink"] = []
 
 
 class InterceptHandler(logging.Handler):
     def emit(self, record: logging.LogRecord) -> None:
-        # Get corresponding Loguru level if it exists.
-        level: str | int
-        try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
-
-        # Find caller from where originated the logged message.
-        frame, depth = inspect.currentframe(), 0
-        while frame and (depth == 0 or frame.f_code.co_filename == logging.__file__):
-            frame = frame.f_back
-            depth += 1
-
-        logger.opt(depth=depth, exception=record.exc_info).log(
-            level, record.getMessage()
-        )
+        # Record yang tidak akan diterima sink manapun: keluar sebelum
+        # frame walk dan dispatch Loguru.
+        if record.levelno < _MIN_LEVEL_NO:
+            return
+
+        # Get corresponding Loguru level if it exists (memoized).
+        level = _LEVEL_BY_NAME.get(record.levelname)
+        if level is None:
+            try:
+                level = logger.level(record.levelname).name
+            except ValueError:
+                level = record.levelno
+            _LEVEL_BY_NAME[record.levelname] = level
+
+        # Atribusi dari field LogRecord sendiri, bukan frame walk: emit
+        # jalan di thread QueueListener, tempat frame pemanggil aslinya
+        # sudah tidak ada — walk di sini selalu salah alamat.
+        message = record.getMessage()
+        if record.exc_text:
+            # Jalur non-queue bisa masih membawa traceback terformat di
+            # exc_text; lewat queue, prepare() sudah membungkusnya ke msg.
+            message = f"{message}\n{record.exc_text}"
+        logger.patch(
+            lambda r: r.update(
+                name=record.name, function=record.funcName, line=record.lineno
+            )
+        ).opt(exception=record.exc_info).log(level, message)
+
 
+class _OrjsonFileSink:
+    """Loguru sink yang menulis JSONL via orjson.
 
-# Add this line to intercept all standard logging
-logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
+    Melewati formatter template Loguru sepenuhnya: tidak ada strftime,
+    tidak ada parsing tag warna — orjson serialize datetime secara native
+    dan hasilnya langsung bytes ke disk.
+
+    Record dikumpulkan di buffer in-memory dan baru di-write saat buffer
+    melewati ambang, atau maksimal FLUSH_INTERVAL detik kemudian — satu
+    syscall untuk banyak record, bukan satu per record. Tidak ada fsync;
+    page cache OS yang mengatur persist ke disk.
+
+    Rotasi (size + harian) diputuskan dari counter byte in-memory dan
+    cek tanggal yang di-gate tiap 1024 record — tanpa os.stat per emit.
+    Kompresi + retention sweep jalan di worker thread terpisah supaya
+    record yang memicu rotasi tidak kena latency spike.
+    """
+
+    FLUSH_BYTES = 256 * 1024
+    FLUSH_INTERVAL = 0.2
+
+    def __init__(self, path: str, size_mb: int = 10, retention_days: int = 7):
+        self._path = path
+        self._max_bytes = size_mb * 1024 * 1024
+        self._retention_days = retention_days
+        self._rotation_executor = ThreadPoolExecutor(max_workers=1)
+        self._file = open(  # noqa: SIM115 - sink memegang handle seumur hidupnya
+            path, "ab", buffering=1 << 20, opener=LoggerManager._opener
+        )
+        # Satu stat saat open; selanjutnya ukuran dilacak in-memory.
+        self._bytes_written = os.path.getsize(path)
+        self._n = 0
+        self._day = date.today()
+        self._buf = bytearray()
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._closed = False
+        # Loguru tidak memanggil close() pada sink callable dan timer flush
+        # berjalan sebagai daemon — tanpa hook ini sisa buffer (maks 256 KB /
+        # 200 ms terakhir) hilang saat proses exit normal.
+        atexit.register(self.close)
+
+    def __call__(self, message: Any) -> None:
+        record = message.record
+        payload = {
+            "t": record["time"].timestamp(),
+            "lvl": record["level"].no,
+            "msg": record["message"],
+            "name": record["name"],
+            "line": record["line"],
+            "extra": record["extra"],
+        }
+        exc = record["exception"]
+        if exc is not None:
+            # Tanpa ini file ERROR kehilangan semua traceback — sink string
+            # bawaan Loguru menempelkan {exception} otomatis, sink custom tidak.
+            payload["exc"] = "".join(
+                traceback.format_exception(exc.type, exc.value, exc.traceback)
+            )
+        # default=str: extra yang tidak JSON-serializable jadi string,
+        # bukan membunuh record-nya.
+        line = orjson.dumps(payload, default=str) + b"\n"
+        with self._lock:
+            self._buf += line
+            self._n += 1
+            if self._bytes_written + len(self._buf) >= self._max_bytes or (
+                (self._n & 1023) == 0 and date.today() != self._day
+            ):
+                self._rotate_locked()
+            elif len(self._buf) >= self.FLUSH_BYTES:
+                self._flush_locked()
+            elif self._timer is None:
+                # Log jarang tetap muncul cepat: flush paling lambat 200 ms.
+                self._timer = threading.Timer(self.FLUSH_INTERVAL, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _flush_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._buf:
+            self._bytes_written += len(self._buf)
+            self._file.write(self._buf)
+            # Teruskan ke OS sekarang; tanpa ini data tertahan di buffer
+            # 1 MB BufferedWriter, bukan di page cache. Tetap tanpa fsync.
+            self._file.flush()
+            self._buf.clear()
+
+    def _rotate_locked(self) -> None:
+        self._flush_locked()
+        self._file.close()
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        rotated = f"{self._path}.{stamp}"
+        os.replace(self._path, rotated)
+        self._file = open(  # noqa: SIM115 - handle baru menggantikan yang dirotasi
+            self._path, "ab", buffering=1 << 20, opener=LoggerManager._opener
+        )
+        self._bytes_written = 0
+        self._day = date.today()
+        # Writer langsung lanjut; gzip + retention di thread worker.
+        self._rotation_executor.submit(self._compress_and_prune, rotated)
+
+    def _compress_and_prune(self, rotated: str) -> None:
+        """Compress a rotated file and drop archives past retention (worker)."""
+        with open(rotated, "rb") as src, gzip.open(f"{rotated}.gz", "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.unlink(rotated)
+        cutoff = time.time() - self._retention_days * 86400
+        base = Path(self._path)
+        for archive in base.parent.glob(f"{base.name}.*.gz"):
+            if archive.stat().st_mtime < cutoff:
+                archive.unlink(missing_ok=True)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Flush sisa buffer lalu tutup file; aman dipanggil berulang."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._flush_locked()
+            self._file.close()
+        # Di luar lock: biarkan kompresi yang sedang jalan selesai dulu.
+        self._rotation_executor.shutdown(wait=True)
 
 
 class LoggerManager:
+    # Konstanta kelas: dibangun sekali saat definisi, bukan per konstruksi
+    # LoggerManager. Tag warna hanya dipakai sink stderr; sink file memakai
+    # _OrjsonFileSink tanpa formatter template sama sekali.
+    FORMAT_SIMPLE = "<level>{level}</level>: <magenta>{name}:{function}:{line}</magenta> | {message} | {extra}"
+    FORMAT_FULL = (
+        "<level>{level}</level>: {time:YYYY-MM-DD HH:mm:ss} | "
+        "<cyan>{process.name}:{thread.name}</cyan> | "
+        "<magenta>{name}:{function}:{line}</magenta> | "
+        "<level>{message}</level> | {extra}"
+    )
+
     def __init__(self, config: LogConfig):
         self.config = config
-        self.FORMAT_SIMPLE = "<level>{level}</level>: <magenta>{name}:{function}:{line}</magenta> | {message} | {extra}"
-        self.FORMAT_FULL = (
-            "<level>{level}</level>: {time:YYYY-MM-DD HH:mm:ss} | "
-            "<cyan>{process.name}:{thread.name}</cyan> | "
-            "<magenta>{name}:{function}:{line}</magenta> | "
-            "<level>{message}</level> | {extra}"
-        )
 
     def setup(self):
         loguru_logger.level("INFO", color="<cyan>")
         loguru_logger.remove()
+        # remove() tidak menutup sink callable; tutup sink file dari setup()
+        # sebelumnya supaya handle + rotation executor-nya tidak bocor per
+        # browser session.
+        while _FILE_SINKS:
+            _FILE_SINKS.pop().close()
+        if self.config.intercept_stdlib:
+            self._setup_stdlib_queue()
         Path(self.config.log_path).mkdir(parents=True, exist_ok=True)
 
         logger_patched = loguru_logger
@@ -164,24 +362,58 @@ class LoggerManager:
             )
         if self.config.to_file:
             for level in ("INFO", "ERROR"):
-                logger_patched.add(
-                    sink=f"{self.config.log_path}/{self.config.name_prefix}_{level.lower()}.log",
-                    level=level,
-                    format=self.FORMAT_FULL,
-                    diagnose=self.config.diagnose,
-                    backtrace=True,
-                    enqueue=self.config.enqueue,
-                    serialize=self.config.serialize,
-                    rotation=f"{self.config.size_mb} MB 00:00",
-                    retention=f"{self.config.retention_days} days",
-                    opener=LoggerManager._opener,
+                sink = _OrjsonFileSink(
+                    f"{self.config.log_path}/{self.config.name_prefix}_{level.lower()}.log",
+                    size_mb=self.config.size_mb,
+                    retention_days=self.config.retention_days,
                 )
+                logger_patched.add(sink=sink, level=level, enqueue=False)
+                _FILE_SINKS.append(sink)
         if self.config.override_stdout:
             self._patch_stdout()
         if self.config.enable_exception_hooks:
             self._setup_exception_hooks()
+        self._update_min_level()
         logger_patched.info(f"log sudah diinisialisasi: {self.config}")
 
+    def _setup_stdlib_queue(self) -> None:
+        """Route stdlib logging through a queue to a listener thread.
+
+        Caller hanya membayar queue.put_nowait; getMessage(), frame walk,
+        formatting, dan I/O sink semua jalan di thread listener.
+        """
+        global _STDLIB_LISTENER
+        with _STDLIB_LISTENER_LOCK:
+            if _STDLIB_LISTENER is not None:
+                return
+            q: queue.SimpleQueue = queue.SimpleQueue()
+            qh = QueueHandler(q)
+            # QueueHandler.prepare() mem-format record sebelum masuk queue;
+            # tanpa ini formatter default basicConfig menempelkan
+            # "LEVEL:name:" di depan tiap message.
+            qh.setFormatter(logging.Formatter("%(message)s"))
+            # Tanpa force=True: hormati handler yang sudah dikonfigurasi caller.
+            logging.basicConfig(handlers=[qh], level=self.config.intercept_level)
+            _STDLIB_LISTENER = QueueListener(q, InterceptHandler())
+            _STDLIB_LISTENER.start()
+            atexit.register(_STDLIB_LISTENER.stop)
+
+    def _update_min_level(self) -> None:
+        """Sync the intercept short-circuit with the lowest active sink level.
+
+        Root logger stdlib ikut dinaikkan supaya record yang pasti dibuang
+        sudah difilter sebelum menyentuh handler sama sekali.
+        """
+        global _MIN_LEVEL_NO
+        _MIN_LEVEL_NO = loguru_logger._core.min_level
+        if self.config.intercept_stdlib:
+            # Tanpa sink sama sekali min_level = inf; setLevel butuh int,
+            # jadi clamp ke CRITICAL (semua record tetap dibuang).
+            level_no = min(
+                max(_MIN_LEVEL_NO, self.config.intercept_level), logging.CRITICAL
+            )
+            logging.getLogger().setLevel(int(level_no))
+
     def _get_format(self) -> str:
         return (
             self.FORMAT_SIMPLE
@@ -191,11 +423,12 @@ class LoggerManager:
 
     @staticmethod
     def _filter_sensitive(record: Any) -> None:
-        msg = str(record["message"]).lower()
-        if any(
-            word in msg
-            for word in ["password", "token", "secret", "apikey", "authorization"]
-        ):
+        msg = record["message"]
+        # Exact type check, bukan isinstance: str subclass jarang dan
+        # type() lebih murah di path yang jalan untuk tiap record.
+        if type(msg) is not str:
+            return None
+        if _SENSITIVE_RE.search(msg):
             record["message"] = "[REDACTED]"
         return None
 
@@ -205,14 +438,26 @@ class LoggerManager:
         class StreamToLogger:
             def __init__(self, level: Level = "INFO"):
                 self.level = level
+                self._buf = ""
+                # Resolve method level-spesifik sekali, bukan per baris.
+                self._log = getattr(loguru_logger, level.lower())
 
             def write(self, buffer: str) -> None:
-                for line in buffer.rstrip().splitlines():
-                    loguru_logger.log(self.level, line.rstrip())
+                # Kumpulkan partial write; emit hanya pada batas newline
+                # supaya satu baris logis = satu record Loguru.
+                self._buf += buffer
+                if "\n" not in self._buf:
+                    return
+                *lines, self._buf = self._buf.split("\n")
+                for line in lines:
+                    if line:
+                        self._log(line.rstrip())
 
             def flush(self) -> None:
-                """This is needed for compatibility with Python's print()."""
-                pass
+                """Emit any residual partial line (needed by print())."""
+                if self._buf:
+                    self._log(self._buf.rstrip())
+                    self._buf = ""
 
         sys.stdout = StreamToLogger("INFO")
         sys.stderr = StreamToLogger("ERROR")
@@ -235,11 +480,24 @@ class LoggerManager:
             loguru_logger.opt(exception=exception).error(f"Async exception: {msg}")
 
         sys.excepthook = global_exception_hook
-        try:
-            loop = asyncio.get_event_loop()
-            loop.set_exception_handler(handle_async_exception)
-        except RuntimeError:
-            pass
+        self._async_exception_handler = handle_async_exception
+        # Hanya pasang kalau memang ada loop yang sedang jalan;
+        # get_event_loop() di 3.12+ mengeluarkan DeprecationWarning dan
+        # diam-diam membuat (lalu membocorkan) loop baru saat tidak ada.
+        # Belum ada loop: pasang nanti via attach_async_exception_handler
+        # begitu aplikasi menjalankan loop-nya.
+        with contextlib.suppress(RuntimeError):
+            asyncio.get_running_loop().set_exception_handler(
+                handle_async_exception
+            )
+
+    def attach_async_exception_handler(
+        self, loop: asyncio.AbstractEventLoop
+    ) -> None:
+        """Attach the async exception handler to a loop created after setup."""
+        handler = getattr(self, "_async_exception_handler", None)
+        if handler is not None:
+            loop.set_exception_handler(handler)
 
     # patch_uvicorn_loggers and patch_loggers removed: use Loguru's InterceptHandler if needed
 
@@ -267,20 +525,20 @@ class LoggerManager:
             # INFO: → foo | args=(1, 2), kwargs={}
             # INFO: ← foo | result=3
         """
-        function_params = ParamSpec("function_params")
-        function_return = TypeVar("function_return")
 
         def wrapper(
-            func: Callable[function_params, function_return],
-        ) -> Callable[function_params, function_return]:
+            func: Callable[_P, _R],
+        ) -> Callable[_P, _R]:
+            # Resolve sekali saat dekorasi; lazy=True menunda repr args/result
+            # sampai record benar-benar lolos filter level/sink.
+            _lazy_log = loguru_logger.opt(lazy=True).log
+            _entry_msg = "→ " + func.__name__ + " | args={}, kwargs={}"
+            _exit_msg = "← " + func.__name__ + " | result={}"
+
             @functools.wraps(func)
-            def wrapped(
-                *args: function_params.args, **kwargs: function_params.kwargs
-            ) -> function_return:
+            def wrapped(*args: _P.args, **kwargs: _P.kwargs) -> _R:
                 if entry:
-                    loguru_logger.log(
-                        level, f"→ {func.__name__} | args={args}, kwargs={kwargs}"
-                    )
+                    _lazy_log(level, _entry_msg, lambda: args, lambda: kwargs)
                 try:
                     result = func(*args, **kwargs)
                 except Exception as e:
@@ -289,7 +547,7 @@ class LoggerManager:
                     )
                     raise
                 if exit:
-                    loguru_logger.log(level, f"← {func.__name__} | result={result}")
+                    _lazy_log(level, _exit_msg, lambda: result)
                 return result
 
             return wrapped
@@ -313,25 +571,22 @@ class LoggerManager:
             # INFO: [process] Starting...
             # INFO: [process] Done in 0.123s
         """
-        timer_params = ParamSpec("timer_params")
-        timer_return = TypeVar("timer_return")
 
         def decorator(
-            func: Callable[timer_params, timer_return],
-        ) -> Callable[timer_params, timer_return]:
+            func: Callable[_P, _R],
+        ) -> Callable[_P, _R]:
+            _log = getattr(loguru_logger, level.lower())
+            _perf = time.perf_counter
+
             @functools.wraps(func)
-            def wrapper(
-                *args: timer_params.args, **kwargs: timer_params.kwargs
-            ) -> timer_return:
+            def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
                 op = operation or func.__name__
 
-                start = time.perf_counter()
+                start = _perf()
                 try:
-                    loguru_logger.log(level, f"[{op}] Starting...")
+                    _log(f"[{op}] Starting...")
                     result = func(*args, **kwargs)
-                    loguru_logger.log(
-                        level, f"[{op}] Done in {time.perf_counter() - start:.3f}s"
-                    )
+                    _log(f"[{op}] Done in {_perf() - start:.3f}s")
                 except Exception as e:
                     loguru_logger.exception(f"[{op}] Failed: {e}")
                     raise
@@ -342,25 +597,14 @@ class LoggerManager:
         return decorator
 
     @staticmethod
-    def log_block(
-        operation: str, level: Level = "INFO"
-    ) -> AbstractContextManager[None]:
-        """Context manager: Log waktu mulai, selesai, dan durasi blok kode."""
-
-        @contextmanager
-        def _block() -> Iterator[None]:
-            start = time.perf_counter()
-            loguru_logger.log(level, f"[{operation}] Starting...")
-            try:
-                yield
-                loguru_logger.log(
-                    level, f"[{operation}] Done in {time.perf_counter() - start:.3f}s"
-                )
-            except Exception as e:
-                loguru_logger.exception(f"[{operation}] Failed: {e}")
-                raise
+    def log_block(operation: str, level: Level = "INFO") -> "LoggerManager.LogContext":
+        """Context manager: Log waktu mulai, selesai, dan durasi blok kode.
 
-        return _block()
+        Alias tipis di atas LogContext: class context manager biasa jauh
+        lebih murah daripada generator @contextmanager (tanpa alokasi
+        generator + dua .send() per blok).
+        """
+        return LoggerManager.LogContext(operation, level)
 
     class LogContext:
         """Context manager (OOP): Log waktu mulai, selesai, dan durasi blok kode, bisa di-extend.
@@ -380,11 +624,11 @@ class LoggerManager:
             self.operation = operation
             self.level = level
             self.start_time = None
-            self._time = time
+            self._log = getattr(loguru_logger, level.lower())
 
         def __enter__(self):
-            self.start_time = self._time.perf_counter()
-            loguru_logger.log(self.level, f"[{self.operation}] Starting...")
+            self.start_time = _perf_counter()
+            self._log(f"[{self.operation}] Starting...")
             return self
 
         def __exit__(
@@ -394,17 +638,15 @@ class LoggerManager:
             exc_tb: TracebackType | None,
         ) -> None:
             if self.start_time is not None:
-                duration = self._time.perf_counter() - self.start_time
+                duration = _perf_counter() - self.start_time
             else:
                 duration = 0.0
             if exc_type:
-                loguru_logger.error(
+                loguru_logger.opt(exception=(exc_type, exc_val, exc_tb)).error(
                     f"[{self.operation}] Failed after {duration:.3f}s: {exc_val}"
                 )
             else:
-                loguru_logger.log(
-                    self.level, f"[{self.operation}] Done in {duration:.3f}s"
-                )
+                self._log(f"[{self.operation}] Done in {duration:.3f}s")
 
 
 logger = loguru_logger
@@ -412,17 +654,14 @@ logger = loguru_logger
 
 def caller_info():
     """Return caller's filename, function name, and line number for logging context."""
-    frame = inspect.currentframe()
-    # Go back two frames: caller_info -> log_exception_with_caller -> actual caller
-    if (
-        frame is not None
-        and frame.f_back is not None
-        and frame.f_back.f_back is not None
-    ):
-        outer_frame = frame.f_back.f_back
-        info = inspect.getframeinfo(outer_frame)
-        return f"{info.filename}:{info.function}:{info.lineno}"
-    return "unknown"
+    # Go back two frames: caller_info -> log_exception_with_caller -> actual caller.
+    # Baca atribut frame langsung; inspect.getframeinfo membuka source file
+    # per call hanya demi tiga field ini.
+    try:
+        frame = sys._getframe(2)
+    except ValueError:
+        return "unknown"
+    return f"{frame.f_code.co_filename}:{frame.f_code.co_name}:{frame.f_lineno}"
 
 
 def log_exception_with_caller(exc: Exception):
@@ -444,15 +683,27 @@ def log_error(exc: Exception, msg: str = ""):
     loguru_logger.opt(exception=exc).error(msg or str(exc))
 
 
-def request_id() -> str:
-    """Generate a unique request ID (UUID).
+# Prefix acak sekali per proses + counter C-level (atomic di bawah GIL);
+# tanpa syscall os.urandom per request seperti uuid4.
+_PROC_ID = secrets.token_hex(4)
+_COUNTER = itertools.count()
+
+
+def request_id(use_uuid: bool = False) -> str:
+    """Generate a unique request ID.
+
+    Default: prefix unik per proses + counter monotonic — jauh lebih murah
+    daripada uuid4 dan tetap unik. Set use_uuid=True kalau butuh UUID
+    global (mis. lintas sistem terdistribusi).
 
     Example:
         >>> from utils.mlogger import request_id
         >>> rid = request_id()
         >>> print(rid)
     """
-    return str(uuid.uuid4())
+    if use_uuid:
+        return str(uuid.uuid4())
+    return f"{_PROC_ID}{next(_COUNTER):x}"
 
 
 __all__ = [